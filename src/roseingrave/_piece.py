@@ -5,12 +5,10 @@ The Piece and Source classes.
 
 # ======================================================================
 
-import re
+import functools
+import sys
 
-from gspread.utils import (
-    a1_range_to_grid_range as gridrange,
-    rowcol_to_a1,
-)
+from gspread.utils import a1_range_to_grid_range as gridrange
 from loguru import logger
 
 from ._shared import error
@@ -21,14 +19,34 @@ __all__ = ('Piece',)
 
 # ======================================================================
 
-HYPERLINK_RE = re.compile(r'=HYPERLINK\("(.+)", "(.+)"\)')
+HYPERLINK_START = '=HYPERLINK("'
+HYPERLINK_SEP = '", "'
+HYPERLINK_END = '")'
+# escapes quotes in hyperlink text
+HYPERLINK_ESCAPE_TABLE = str.maketrans({'"': '\\"'})
 
 # ======================================================================
 
 
+@functools.lru_cache(maxsize=4096)
 def _col_str(col):
     """Return the column string of a column number (1-indexed)."""
-    return rowcol_to_a1(1, col)[:-1]
+    col_str = ''
+    while col > 0:
+        col, rem = divmod(col - 1, 26)
+        col_str = chr(ord('A') + rem) + col_str
+    return col_str
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_range(range_name):
+    """Return the grid range of an A1 range, without a sheet id."""
+    return gridrange(range_name)
+
+
+def _grid_range(range_name, sheet_id):
+    """Return a new grid range dict of an A1 range in a sheet."""
+    return {**_parse_range(range_name), 'sheetId': sheet_id}
 
 # ======================================================================
 
@@ -46,7 +64,7 @@ def _hyperlink(text, link=None):
 
     if link is None:
         return text
-    escaped = text.replace('"', '\\"')
+    escaped = text.translate(HYPERLINK_ESCAPE_TABLE)
     return f'=HYPERLINK("{link}", "{escaped}")'
 
 
@@ -62,10 +80,21 @@ def _parse_hyperlink(hyperlink):
             is invalid.
     """
 
-    match = HYPERLINK_RE.match(hyperlink)
-    if match is None:
+    # the format is fixed, so string methods are enough
+    if not (hyperlink.startswith(HYPERLINK_START) and
+            hyperlink.endswith(HYPERLINK_END)):
+        return None, None
+    start = len(HYPERLINK_START)
+    end = len(hyperlink) - len(HYPERLINK_END)
+    # quotes in the text are escaped, so the last separator is the
+    # one between the link and the text
+    sep = hyperlink.rfind(HYPERLINK_SEP, start, end)
+    if sep == -1:
         return None, None
-    link, text = match.groups()
+    link = hyperlink[start:sep]
+    text = hyperlink[sep + len(HYPERLINK_SEP):end]
+    if '\\"' not in text:
+        return link, text
     return link, text.replace('\\"', '"')
 
 
@@ -195,31 +224,42 @@ class Piece:
         self._template = template
 
         if self._template is None:
+            self._headers = None
             self._values = None
             return
 
+        # template field keys, interned since they're looked up for
+        # every column of a master sheet
+        self._headers = tuple(
+            sys.intern(header)
+            for header in template['metaDataFields'].keys()
+        )
+
+        # the rows are shared by every sheet, so they're immutable
+
         # row 1 in `create_sheet()`
 
-        before_bars = []
-        # all other rows from template
-        before_bars += [
-            [header]
-            for header in template['metaDataFields'].values()
-        ]
-        # empty row
-        before_bars.append([])
+        before_bars = (
+            # all other rows from template
+            *(
+                (header,)
+                for header in template['metaDataFields'].values()
+            ),
+            # empty row
+            (),
+        )
 
         # bars section goes here
 
-        after_bars = [
+        after_bars = (
             # empty row
-            [],
+            (),
             # comments row
-            [template['commentFields']['comments']]
-        ]
+            (template['commentFields']['comments'],),
+        )
 
         # before bar section, after bar section
-        self._values = [before_bars, after_bars]
+        self._values = (before_bars, after_bars)
 
     @property
     def name(self):
@@ -249,23 +289,27 @@ class Piece:
         # add all sources
         for source in sources:
             name = source.name
-            if name in self._sources:
+            # intern the name since it's used as a key in later lookups
+            if isinstance(name, str):
+                name = sys.intern(name)
+            existing_source = self._sources.get(name, None)
+            if existing_source is not None:
                 logger.debug(
                     'Combining source "{}" in piece "{}"',
                     name, self._name
                 )
-                existing_source = self._sources[name]
                 existing_source.combine(source)
                 if existing_source.is_supplemental:
                     self._supplemental_sources[name] = existing_source
                     self._sources.pop(name)
                 continue
-            if name in self._supplemental_sources:
+            existing_source = self._supplemental_sources.get(name, None)
+            if existing_source is not None:
                 logger.debug(
                     'Combining source "{}" in piece "{}"',
                     name, self._name
                 )
-                self._supplemental_sources[name].combine(source)
+                existing_source.combine(source)
                 continue
             if source.is_supplemental:
                 self._supplemental_sources[name] = source
@@ -376,22 +420,21 @@ class Piece:
         sheet = spreadsheet.add_worksheet(self._name, 1, 1)
 
         # complete row 1
-        row1 = (
-            [_hyperlink(self._name, self._link)] +
-            [source.hyperlink() for source in self._sources.values()] +
-            [self._template['commentFields']['notes']]
-        )
+        row1 = [
+            _hyperlink(self._name, self._link),
+            *(source.hyperlink() for source in self._sources.values()),
+            self._template['commentFields']['notes'],
+        ]
 
         # proper bar count
         bar_count = self.final_bar_count
 
-        values = [
-            row1,
-            # use copy of `self._values`
-            *[row[:] for row in self._values[0]],
-            *[[i + 1] for i in range(bar_count)],
-            *[row[:] for row in self._values[1]],
-        ]
+        # extend directly to avoid building intermediate lists
+        values = [row1]
+        # use copy of `self._values`
+        values.extend(list(row) for row in self._values[0])
+        values.extend([bar_num] for bar_num in range(1, bar_count + 1))
+        values.extend(list(row) for row in self._values[1])
 
         notes_col = len(values[0])
         blank_row1 = 1 + len(self._values[0])  # row 1 + headers
@@ -452,90 +495,90 @@ class Piece:
         # proper bar count
         bar_count = self.final_bar_count
 
-        # finish headers
-        values = [
-            [_hyperlink(self._name, self._link)],
-            ['Volunteer'],
-            # use copy of `self._values`
-            *[row[:] for row in self._values[0]],
-            *[[i + 1] for i in range(bar_count)],
-            *[row[:] for row in self._values[1]],
-        ]
-
-        headers = tuple(self._template['metaDataFields'].keys())
-
-        headers_start = 2
-        headers_iter = [
-            (headers_start + i, header)
-            for i, header in enumerate(headers)
-        ]
+        headers = self._headers
+        bar_nums = [str(i + 1) for i in range(bar_count)]
 
         blank_row1 = 2 + len(headers) + 1  # 2 rows + headers
         blank_row2 = blank_row1 + bar_count + 1
         comments_row = blank_row2 + 1
 
-        bars_start = blank_row1
-        bars_iter = [
-            (bars_start + i, str(i + 1))
-            for i in range(bar_count)
-        ]
+        # build the sheet column by column, then transpose at the end
+
+        # headers column
+        columns = [[
+            _hyperlink(self._name, self._link),
+            'Volunteer',
+            # use `self._values` for the header names and empty rows
+            *(row[0] if len(row) > 0 else '' for row in self._values[0]),
+            *range(1, bar_count + 1),
+            *(row[0] if len(row) > 0 else '' for row in self._values[1]),
+        ]]
+
+        def make_column(email, volunteer):
+            bars = volunteer['bars']
+            return [
+                # row 1
+                '',
+                # row 2
+                email,
+                # headers
+                *[volunteer[header] for header in headers],
+                # empty row
+                '',
+                # bars
+                *[bars[bar_num] for bar_num in bar_nums],
+                # empty row
+                '',
+                # comments
+                volunteer['comments'],
+            ]
 
         # go through sources and add
         sources = piece_data['sources']
+        summary_title = self._template['commentFields']['summary']
         # list of starting col number for each source (1-indexed)
         source_cols = []
-        col = 2
         for name, source in self._sources.items():
             source_data = sources[name]
-            source_cols.append(col)
-
-            def add_column(email, volunteer):
-                # row 1
-                values[0].append('')
-                # row 2
-                values[1].append(email)
-                # headers
-                for row, header in headers_iter:
-                    values[row].append(volunteer[header])
-                # bars
-                bars = volunteer['bars']
-                for row, bar_num in bars_iter:
-                    values[row].append(bars[bar_num])
-                # comments
-                values[comments_row - 1].append(volunteer['comments'])
-
-            start_col = col - 1
+            start_col = len(columns)
+            source_cols.append(start_col + 1)
 
             # volunteers
             for email, volunteer in source_data['volunteers'].items():
-                add_column(email, volunteer)
-                col += 1
+                columns.append(make_column(email, volunteer))
             # summary
-            add_column(
-                self._template['commentFields']['summary'],
-                source_data['summary']
-            )
-            col += 1
+            columns.append(make_column(summary_title, source_data['summary']))
 
             # put the source hyperlink
-            values[0][start_col] = source.hyperlink()
+            columns[start_col][0] = source.hyperlink()
 
         # notes column
-        notes_col = col
+        notes_col = len(columns) + 1
 
         def note_str(notes):
-            return '\n'.join(
+            return '\n'.join([
                 f'{email}: {note}'
                 for email, note in notes.items()
-            )
+            ])
 
-        values[0].append(self._template['commentFields']['notes'])
         notes = piece_data['notes']
-        for row, header in headers_iter:
-            values[row].append(note_str(notes[header]))
         bars = notes['bars']
-        for row, bar_num in bars_iter:
-            values[row].append(note_str(bars[bar_num]))
+        columns.append([
+            # row 1
+            self._template['commentFields']['notes'],
+            # row 2
+            '',
+            # headers
+            *[note_str(notes[header]) for header in headers],
+            # empty row
+            '',
+            # bars
+            *[note_str(bars[bar_num]) for bar_num in bar_nums],
+            # empty row, comments
+            '', '',
+        ])
+
+        values = [list(row) for row in zip(*columns)]
 
         # force headers column to be 202 pixels minimum
         resize = self._template['masterSpreadsheet']['resize']
@@ -582,27 +625,28 @@ class Piece:
             return error(msg.format(*args, **kwargs), ERROR_RETURN)
 
         (
-            values,
+            columns,
             piece_link, piece_name,
             headers_iter, bars_iter,
             comments_row, notes_col,
         ) = _export_helper(sheet, template, is_master=True)
 
         def export_column(col, include_comments=True):
+            values = columns[col]
             column = {}
             for row, header in headers_iter:
-                column[header] = values[row][col]
+                column[header] = values[row]
             bars = {}
-            for row in bars_iter:
-                bars[values[row][0]] = values[row][col]
+            for row, bar_num in bars_iter:
+                bars[bar_num] = values[row]
             column['bars'] = bars
             if include_comments:
-                column['comments'] = values[comments_row][col]
+                column['comments'] = values[comments_row]
             return column
 
         sources = []
         for col in range(1, notes_col):
-            link, name = _parse_hyperlink(values[0][col])
+            link, name = _parse_hyperlink(columns[col][0])
             if link is None:
                 return _error(
                     'sheet "{}": column {} doesn\'t have a valid '
@@ -647,7 +691,7 @@ class Piece:
             return error(msg.format(*args, **kwargs), ERROR_RETURN)
 
         (
-            values,
+            columns,
             piece_link, piece_name,
             headers_iter, bars_iter,
             comments_row, notes_col,
@@ -656,9 +700,11 @@ class Piece:
         sources = []
         curr_source = {}
         for col in range(1, notes_col):
-            if values[0][col] != '':
+            values = columns[col]
+
+            if values[0] != '':
                 # new source
-                link, name = _parse_hyperlink(values[0][col])
+                link, name = _parse_hyperlink(values[0])
                 if link is None:
                     return _error(
                         'sheet "{}": column {} doesn\'t have a valid '
@@ -675,16 +721,19 @@ class Piece:
                 sources.append(curr_source)
 
             # always overwrite summary, pushing existing to volunteers
-            email = values[1][col]
+            email = values[1]
+            # emails repeat across sources and pieces
+            if isinstance(email, str):
+                email = sys.intern(email)
 
             column = {}
             for row, header in headers_iter:
-                column[header] = values[row][col]
+                column[header] = values[row]
             bars = {}
-            for row in bars_iter:
-                bars[values[row][0]] = values[row][col]
+            for row, bar_num in bars_iter:
+                bars[bar_num] = values[row]
             column['bars'] = bars
-            column['comments'] = values[comments_row][col]
+            column['comments'] = values[comments_row]
 
             if curr_source['summary'] is not None:
                 # push to volunteers
@@ -705,19 +754,21 @@ class Piece:
                     continue
                 try:
                     email, text = line.split(': ', 1)
-                    note[email] = text
+                    # emails repeat across every note cell
+                    note[sys.intern(email)] = text
                 except ValueError:
                     logger.warning(
                         'Note line has invalid format: {}', line
                     )
             return note
 
+        values = columns[notes_col]
         notes = {}
         for row, header in headers_iter:
-            notes[header] = parse_note(values[row][notes_col])
+            notes[header] = parse_note(values[row])
         bars = {}
-        for row in bars_iter:
-            bars[values[row][0]] = parse_note(values[row][notes_col])
+        for row, bar_num in bars_iter:
+            bars[bar_num] = parse_note(values[row])
         notes['bars'] = bars
 
         return True, {
@@ -737,7 +788,24 @@ def _format_sheet(spreadsheet, sheet, template,
                   ):
     """Format a piece sheet."""
 
-    sheet_id = sheet.id
+    if source_cols is None:
+        source_cols = []
+
+    requests = _format_requests(
+        sheet.id, template,
+        notes_col, blank_row1, blank_row2, comments_row,
+        resize, is_master, source_cols, has_supplemental_col
+    )
+
+    body = {'requests': requests}
+    spreadsheet.batch_update(body)
+
+
+def _format_requests(sheet_id, template,
+                     notes_col, blank_row1, blank_row2, comments_row,
+                     resize, is_master, source_cols, has_supplemental_col
+                     ):
+    """Create the requests to format a piece sheet."""
 
     def hex_to_rgb(hex_color):
         """Changes a hex color code (no pound) to an RGB color dict.
@@ -753,9 +821,7 @@ def _format_sheet(spreadsheet, sheet, template,
 
     header_end = 2 if is_master else 1
 
-    if source_cols is None:
-        source_cols = []
-    source_cols.append(notes_col)
+    source_cols = source_cols + [notes_col]
 
     requests = []
 
@@ -831,18 +897,19 @@ def _format_sheet(spreadsheet, sheet, template,
     ]
     if is_master:
         # make all summary cells be centered
-        center_align = {
-            'cell': {
-                'userEnteredFormat': {
-                    'horizontalAlignment': 'CENTER',
-                },
-            },
-            'fields': 'userEnteredFormat.horizontalAlignment',
-        }
-        range_formats += [
-            (f'{_col_str(col - 1)}2', center_align)
-            for col in source_cols[1:]
-        ]
+        # (a source with no volunteers has its summary column right
+        # after the previous one, so neighbouring cells share a range)
+        summary_cols = [col - 1 for col in source_cols[1:]]
+        start_col = None
+        for col, next_col in zip(summary_cols, summary_cols[1:] + [None]):
+            if start_col is None:
+                start_col = col
+            if next_col == col + 1:
+                continue
+            range_formats.append(
+                (f'{_col_str(start_col)}2:{_col_str(col)}2', centered)
+            )
+            start_col = None
         # make volunteers line bolded
         range_formats += [
             (f'B2:{source_end_column}2', bolded),
@@ -850,7 +917,7 @@ def _format_sheet(spreadsheet, sheet, template,
     for range_name, fmt in range_formats:
         requests.append({
             'repeatCell': {
-                'range': gridrange(range_name, sheet_id=sheet_id),
+                'range': _grid_range(range_name, sheet_id),
                 **fmt,
             }
         })
@@ -908,27 +975,35 @@ def _format_sheet(spreadsheet, sheet, template,
         (f'A{blank_row2}:{blank_row2}', top_bottom_border),
     ]
 
-    # dotted border after every fifth bar
-    interval = 5
-    bottom_dotted_border = {
-        'bottom': {
-            'style': 'DOTTED',
-            'color': BLACK,
-        }
-    }
-    range_borders += [
-        (f'A{row}:{row}', bottom_dotted_border) for row in
-        range(blank_row1 + interval, blank_row2 - 1, interval)
-    ]
-
     for range_name, borders in range_borders:
         requests.append({
             'updateBorders': {
-                'range': gridrange(range_name, sheet_id=sheet_id),
+                'range': _grid_range(range_name, sheet_id),
                 **borders,
             }
         })
 
+    # dotted border after every fifth bar
+    # each request only takes one range, so there's one per bar row;
+    # build the single-row ranges directly instead of parsing A1 ranges
+    interval = 5
+    dotted_border = {
+        'style': 'DOTTED',
+        'color': BLACK,
+    }
+    requests.extend({
+        'updateBorders': {
+            'range': {
+                'sheetId': sheet_id,
+                # 0-indexed here
+                'startRowIndex': row - 1,
+                'endRowIndex': row,
+                'startColumnIndex': 0,
+            },
+            'bottom': dotted_border,
+        }
+    } for row in range(blank_row1 + interval, blank_row2 - 1, interval))
+
     column_widths = []
     if not resize:
         column_widths.append(
@@ -1074,8 +1149,7 @@ def _format_sheet(spreadsheet, sheet, template,
             }
         })
 
-    body = {'requests': requests}
-    spreadsheet.batch_update(body)
+    return requests
 
 # ======================================================================
 
@@ -1083,10 +1157,14 @@ def _format_sheet(spreadsheet, sheet, template,
 def _export_helper(sheet, template, is_master):
     """Export a sheet and get important helper values."""
 
-    values = sheet.get_values(value_render_option='formula')
+    # get the values column by column, since they're exported by column
+    columns = sheet.get_values(
+        value_render_option='formula', major_dimension='COLUMNS'
+    )
+    num_rows = len(columns[0])
 
     # row 1
-    row1 = values[0]
+    row1 = [column[0] for column in columns]
 
     piece_link, piece_name = _parse_hyperlink(row1[0])
     if piece_name is None:
@@ -1096,12 +1174,19 @@ def _export_helper(sheet, template, is_master):
 
     start_row = 2 if is_master else 1
     headers_range = (start_row, start_row + len(headers))
-    headers_iter = list(zip(range(*headers_range), headers))
-
-    bars_range = (start_row + len(headers) + 1, len(values) - 2)
-    bars_iter = list(range(*bars_range))
+    # intern the keys since they're used for every column
+    headers_iter = list(zip(
+        range(*headers_range), map(sys.intern, headers)
+    ))
+
+    bars_range = (start_row + len(headers) + 1, num_rows - 2)
+    # bar labels are the same for every column, so get them once
+    bars_iter = [
+        (row, sys.intern(str(columns[0][row])))
+        for row in range(*bars_range)
+    ]
 
-    comments_row = len(values) - 1
+    comments_row = num_rows - 1
 
     # skip over supplemental sources column
     notes_col = len(row1) - 1
@@ -1113,7 +1198,7 @@ def _export_helper(sheet, template, is_master):
         notes_col = len(row1) - 1
 
     return (
-        values,
+        columns,
         piece_link, piece_name,
         headers_iter, bars_iter,
         comments_row, notes_col,
@@ -5,6 +5,8 @@ The PieceData and SourceData classes.
 
 # ======================================================================
 
+import sys
+
 from loguru import logger
 
 from ._shared import fail_on_warning
@@ -88,7 +90,7 @@ class PieceData:
         """
 
         self._bar_count = piece.final_bar_count
-        self._headers = list(piece._template['metaDataFields'].keys())
+        self._headers = piece._headers
 
         self._name = piece.name
         self._link = piece.link
@@ -155,9 +157,9 @@ class PieceData:
 
         # template names
         values = {key: value() for key in self._headers}
-        # bars
+        # bars (interned, since they're looked up for every sheet column)
         values['bars'] = {
-            str(bar_num + 1): value()
+            sys.intern(str(bar_num + 1)): value()
             for bar_num in range(self._bar_count)
         }
         # comments
@@ -269,6 +271,9 @@ class PieceData:
             bool: Whether the addition was successful.
         """
 
+        # intern the email since it's a key in every source and note
+        email = sys.intern(email)
+
         p_loc = f'volunteer "{email}", piece "{self._name}"'
 
         link = data['link']